@@ -4,40 +4,418 @@ Semantic Scholar API Query Tool for Longevity Research
 Implements retry logic with multiple query formulations
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import hashlib
 import json
 import os
+import random
+import sqlite3
 import sys
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from types import ModuleType
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple, Iterator
+from urllib.parse import urlencode, urlsplit
 
-# Load .env file from project root
 try:
-    from dotenv import load_dotenv
-    # Find project root (4 levels up from this script)
-    project_root = Path(__file__).parent.parent.parent.parent
-    env_path = project_root / ".env"
-    load_dotenv(dotenv_path=env_path)
+    import orjson
 except ImportError:
-    # python-dotenv not installed, fall back to existing env vars
-    pass
+    # orjson not installed, fall back to the stdlib json module
+    orjson = None
+
+if TYPE_CHECKING:
+    import http.client
+
+
+def load_env() -> None:
+    """Load the project .env file unless the API key is already set or the file is absent"""
+    if os.environ.get("SEMANTIC_SCHOLAR_API_KEY"):
+        return
+
+    # Project root: this script lives in <root>/.claude/skills/longevity-scholar/scripts/
+    ancestors = Path(__file__).resolve().parents
+    if len(ancestors) < 5:
+        return
+    env_path = ancestors[4] / ".env"
+    if not env_path.is_file():
+        return
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        # python-dotenv not installed, fall back to existing env vars
+        return
+
+    load_dotenv(dotenv_path=os.fspath(env_path), override=False)
+
+
+def import_http_client() -> ModuleType:
+    """
+    Import http.client on first use
+
+    It pulls in ssl and the email package, roughly half of the script's
+    startup time, and runs answered from the disk cache never need it.
+    """
+    import http.client
+    return http.client
+
+
+def parse_json(payload: bytes) -> Any:
+    """
+    Decode a JSON response body, parsing the raw bytes directly when orjson is available
+
+    Both parsers already reuse a single string object for each repeated key
+    (e.g. "title" across all papers), so no separate interning pass is needed.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def dump_json(obj: Any) -> str:
+    """Serialize obj as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def dump_json_line(obj: Any) -> bytes:
+    """Serialize obj as compact single-line JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class QueryCancelled(Exception):
+    """Raised when a search is abandoned because another query already succeeded"""
+
+
+class HTTPStatusError(Exception):
+    """Raised when the API answers with a non-200 status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP Error {status}: {message}")
+        self.status = status
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Adaptive token bucket for client-side rate limiting
+
+    The refill rate grows additively on success and shrinks multiplicatively
+    when the server throttles, so pacing follows the API's actual capacity.
+    """
+
+    def __init__(
+        self,
+        capacity: float = 1.0,
+        rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5
+    ):
+        self.capacity = capacity
+        self.tokens = capacity
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self, cancelled: Optional[threading.Event] = None) -> bool:
+        """
+        Block until a token is available, then consume it
+
+        Returns:
+            False if cancelled was set while waiting, True once a token is consumed
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    wait = (1 - self.tokens) / self.rate
+            if cancelled is None:
+                time.sleep(wait)
+            elif cancelled.wait(wait):
+                return False
+
+    def increase_rate(self) -> None:
+        """Additively raise the refill rate after a successful request"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def decrease_rate(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicatively lower the refill rate after the server throttled us"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class DiskCache:
+    """SQLite-backed cache of raw API responses, keyed by the ordered query parameters"""
+
+    DEFAULT_PATH = Path.home() / ".cache" / "longevity-scholar" / "papers.sqlite"
+    # Entries older than this are purged on write. The cache file is shared by
+    # every caller, so this must not depend on the per-call ttl.
+    MAX_AGE = 30 * 86400
+
+    def __init__(self, path: Path = DEFAULT_PATH, ttl: float = 86400):
+        self.path = path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(params: List[Tuple[str, Any]]) -> str:
+        return hashlib.sha1(json.dumps(params).encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, ts REAL, payload BLOB)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached payload for key, or None if missing, expired or unreadable"""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT ts, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except (OSError, sqlite3.Error):
+                return None
+
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        try:
+            return zlib.decompress(row[1])
+        except zlib.error:
+            return None
+
+    def put(self, key: str, payload: bytes) -> None:
+        """Store payload under key and purge expired entries; cache write failures are ignored"""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM responses WHERE ts < ?", (now - max(self.ttl, self.MAX_AGE),))
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, ts, payload) VALUES (?, ?, ?)",
+                    (key, now, zlib.compress(payload))
+                )
+                conn.commit()
+            except (OSError, sqlite3.Error):
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 class SemanticScholarAPI:
     """Simple Semantic Scholar API client with retry logic"""
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    FIELDS = "paperId,title,abstract,authors,year,citationCount,publicationDate,url,venue"
+    BULK_SORT = "citationCount:desc"
+    RETRYABLE_STATUSES = (429, 502, 503, 504)
+    KEYED_MAX_RATE = 1.0
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        cache: Optional[DiskCache] = None,
+        max_connections: int = 3
+    ):
         self.api_key = api_key or os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
-        self.headers = {}
+        self.headers: Dict[str, str] = {}
         if self.api_key:
             self.headers["x-api-key"] = self.api_key
 
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # API-key holders are limited to 1 request/s, so never ramp above that;
+        # unauthenticated requests share a pool and may adapt upwards
+        self.rate_limiter = TokenBucket(max_rate=self.KEYED_MAX_RATE) if self.api_key else TokenBucket()
+        self.cache = cache
+
+        # Bounded pool of keep-alive connections shared by all threads, so
+        # concurrent queries reuse warm connections instead of paying a
+        # TCP+TLS handshake per request
+        base = urlsplit(self.BASE_URL)
+        self._host = base.netloc
+        self._base_path = base.path
+        self._search_path = f"{self._base_path}/paper/search"
+        self._bulk_search_path = f"{self._base_path}/paper/search/bulk"
+        self._connections: List[http.client.HTTPSConnection] = []
+        self._idle_connections: List[http.client.HTTPSConnection] = []
+        self._connections_lock = threading.Lock()
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+
+    @contextmanager
+    def _connection(self) -> Iterator[http.client.HTTPSConnection]:
+        """Check out an idle pooled connection, opening a new one if the pool has spare slots"""
+        with self._connection_slots:
+            with self._connections_lock:
+                if self._idle_connections:
+                    conn = self._idle_connections.pop()
+                else:
+                    conn = import_http_client().HTTPSConnection(self._host, timeout=30)
+                    self._connections.append(conn)
+            try:
+                yield conn
+            finally:
+                with self._connections_lock:
+                    self._idle_connections.append(conn)
+
+    def _get(self, path: str) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Issue a GET request over a pooled keep-alive connection
+
+        Reconnects once if the server dropped the idle connection.
+
+        Returns:
+            Tuple of (HTTP status, response headers, response body)
+        """
+        with self._connection() as conn:
+            for attempt in range(2):
+                try:
+                    conn.request("GET", path, headers=self.headers)
+                    response = conn.getresponse()
+                    return response.status, response.headers, response.read()
+                except ConnectionError:
+                    conn.close()
+                    if attempt:
+                        raise
+                except Exception:
+                    conn.close()
+                    raise
+
+    def _fetch(self, path: str, cancelled: Optional[threading.Event] = None) -> bytes:
+        """
+        GET path, pacing requests through the rate limiter and retrying transient failures
+
+        Stops before the next attempt, or mid-backoff, once cancelled is set.
+
+        Returns:
+            Response body of the first successful (HTTP 200) attempt
+        """
+        for attempt in range(self.max_retries):
+            if not self.rate_limiter.acquire(cancelled):
+                raise QueryCancelled()
+            try:
+                status, headers, body = self._get(path)
+            except (import_http_client().HTTPException, OSError) as e:
+                raise Exception(f"URL Error: {e}")
+
+            if status == 200:
+                self.rate_limiter.increase_rate()
+                return body
+
+            # Cap the server's Retry-After so neither the backoff sleep nor the
+            # rate limiter's block can stall the CLI longer than max_delay
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                retry_after = min(retry_after, self.max_delay)
+            if status == 429 or status >= 500:
+                self.rate_limiter.decrease_rate(retry_after)
+
+            if status not in self.RETRYABLE_STATUSES or attempt == self.max_retries - 1:
+                raise HTTPStatusError(status, body.decode(errors="replace"))
+
+            # Back off exponentially with jitter unless the server told us how long to wait
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt) + random.uniform(0, self.base_delay)
+            if cancelled is None:
+                time.sleep(delay)
+            elif cancelled.wait(delay):
+                raise QueryCancelled()
+
+        raise Exception("No request attempts were made")
+
+    def _get_json(
+        self,
+        path: str,
+        params: List[Tuple[str, Any]],
+        cancelled: Optional[threading.Event] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Fetch and decode path with params, serving from and populating the disk cache if use_cache"""
+        cache = self.cache if use_cache else None
+        cache_key = DiskCache.make_key([("path", path), *params])
+        body = cache.get(cache_key) if cache else None
+        from_cache = body is not None
+        if not from_cache:
+            body = self._fetch(f"{path}?{urlencode(params)}", cancelled)
+
+        try:
+            data = parse_json(body)
+        except ValueError as e:
+            raise Exception(f"Request failed: {str(e)}")
+
+        if cache and not from_cache:
+            cache.put(cache_key, body)
+
+        return data
+
     def search_papers(
         self,
         query: str,
@@ -45,11 +423,19 @@ class SemanticScholarAPI:
         offset: int = 0,
         year_filter: Optional[str] = None,
         date_filter: Optional[str] = None,
-        sort: str = "recent"
+        sort: str = "recent",
+        cancelled: Optional[threading.Event] = None
     ) -> Dict[str, Any]:
         """
         Search for papers using the Semantic Scholar API
 
+        "recent" uses relevance search, which returns just the requested page.
+        "citations" uses the bulk search endpoint so the most cited papers are
+        ranked server-side across all matches. Bulk search requires every term
+        to match and reads + | - " * ( ) ~ as operators, so if it rejects the
+        request or finds nothing, falls back to relevance search and sorts that
+        page by citations locally.
+
         Args:
             query: Search query string
             limit: Number of results to return (max 100)
@@ -57,49 +443,107 @@ class SemanticScholarAPI:
             year_filter: Year range filter (e.g., "2020-" for 2020 onwards)
             date_filter: Date range filter (e.g., "2024-10-01:" for Oct 1 2024 onwards)
             sort: Sort order - "recent" or "citations"
+            cancelled: Event that, once set, makes pending retries give up with QueryCancelled
 
         Returns:
             Dictionary with keys: total, offset, next, data
         """
-        # Build query parameters
-        params = {
-            "query": query,
-            "limit": min(limit, 100),
-            "offset": offset,
-            "fields": "paperId,title,abstract,authors,year,citationCount,publicationDate,url,venue"
-        }
+        limit = min(limit, 100)
 
         # Use date_filter if provided (more precise), otherwise fall back to year_filter
+        filters: List[Tuple[str, Any]] = []
         if date_filter:
-            params["publicationDateOrYear"] = date_filter
+            filters.append(("publicationDateOrYear", date_filter))
         elif year_filter:
-            params["year"] = year_filter
-
-        # Note: The API endpoint is /paper/search, sorting is applied post-fetch
-        url = f"{self.BASE_URL}/paper/search?{urlencode(params)}"
+            filters.append(("year", year_filter))
+
+        if sort == "citations":
+            try:
+                data = self._search_bulk(query, limit, offset, filters, cancelled)
+                if data["data"]:
+                    return data
+            except HTTPStatusError as e:
+                if e.status != 400:
+                    raise
+
+        # Build query parameters in a fixed order so the cache key is deterministic
+        params = [
+            ("query", query),
+            ("limit", limit),
+            ("offset", offset),
+            ("fields", self.FIELDS),
+            *filters
+        ]
+        data = self._get_json(self._search_path, params, cancelled)
+
+        # Apply sorting if needed
+        if sort == "citations" and data.get("data"):
+            papers = data["data"]
+            for paper in papers:
+                # Missing or null counts sort as zero
+                if paper.get("citationCount") is None:
+                    paper["citationCount"] = 0
+            papers.sort(key=itemgetter("citationCount"), reverse=True)
+
+        return data
+
+    def _search_bulk(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        filters: List[Tuple[str, Any]],
+        cancelled: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Search via /paper/search/bulk, which sorts results by citation count server-side
 
-        try:
-            request = Request(url, headers=self.headers)
-            with urlopen(request, timeout=30) as response:
-                data = json.loads(response.read().decode())
-
-                # Apply sorting if needed
-                if sort == "citations" and "data" in data:
-                    data["data"] = sorted(
-                        data["data"],
-                        key=lambda x: x.get("citationCount", 0),
-                        reverse=True
-                    )
-
-                return data
-
-        except HTTPError as e:
-            error_msg = e.read().decode() if e.fp else str(e)
-            raise Exception(f"HTTP Error {e.code}: {error_msg}")
-        except URLError as e:
-            raise Exception(f"URL Error: {e.reason}")
-        except Exception as e:
-            raise Exception(f"Request failed: {str(e)}")
+        The bulk endpoint has no limit/offset parameters; it returns pages of
+        up to 1000 papers (abstracts included, typically a few MB) linked by a
+        continuation token, so pages are read until the requested window is
+        covered. That is far more data than a relevance search page, which is
+        why only --sort citations takes this path.
+        """
+        params = [
+            ("query", query),
+            ("fields", self.FIELDS),
+            ("sort", self.BULK_SORT),
+            *filters
+        ]
+        end = offset + limit
+
+        # Cache the assembled window rather than raw pages: pages are large and
+        # carry continuation tokens that go stale long before the cache TTL
+        cache_key = DiskCache.make_key(
+            [("path", self._bulk_search_path), *params, ("limit", limit), ("offset", offset)]
+        )
+        cached = self.cache.get(cache_key) if self.cache else None
+        if cached is not None:
+            return parse_json(cached)
+
+        papers: List[Dict[str, Any]] = []
+        token = None
+        while True:
+            page_params = params + ([("token", token)] if token else [])
+            page = self._get_json(self._bulk_search_path, page_params, cancelled, use_cache=False)
+            papers.extend(page.get("data") or [])
+            token = page.get("token")
+            if len(papers) >= end or not token:
+                break
+
+        total = page.get("total", len(papers))
+        data = {"total": total, "offset": offset, "data": papers[offset:end]}
+        if end < total:
+            data["next"] = end
+
+        if self.cache:
+            self.cache.put(cache_key, dump_json_line(data))
+        return data
+
+
+def normalize_queries(queries: List[str]) -> List[str]:
+    """Strip whitespace, drop blank queries and remove duplicates, keeping order"""
+    return list(dict.fromkeys(q for q in (query.strip() for query in queries) if q))
 
 
 def query_with_retry(
@@ -113,7 +557,7 @@ def query_with_retry(
     verbose: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
-    Try multiple queries in sequence until one succeeds
+    Run all queries concurrently and return the first one, in query order, that succeeds
 
     Args:
         api: SemanticScholarAPI instance
@@ -128,70 +572,82 @@ def query_with_retry(
     Returns:
         API response dict or None if all queries fail
     """
-    for i, query in enumerate(queries, 1):
-        if verbose:
-            print(f"Attempting query {i}/{len(queries)}: '{query}'", file=sys.stderr)
-
-        try:
-            result = api.search_papers(
-                query=query,
-                limit=limit,
-                offset=offset,
-                year_filter=year_filter,
-                date_filter=date_filter,
-                sort=sort
-            )
-
-            # Check if we got results
-            if result.get("data") and len(result["data"]) > 0:
+    # Set once a query succeeds so the remaining workers stop retrying
+    cancelled = threading.Event()
+
+    def search(query: str) -> Dict[str, Any]:
+        return api.search_papers(
+            query=query,
+            limit=limit,
+            offset=offset,
+            year_filter=year_filter,
+            date_filter=date_filter,
+            sort=sort,
+            cancelled=cancelled
+        )
+
+    queries = normalize_queries(queries)
+    if not queries:
+        return None
+
+    if verbose:
+        print(f"Running {len(queries)} queries concurrently", file=sys.stderr)
+
+    executor = ThreadPoolExecutor(max_workers=len(queries))
+    try:
+        futures = [executor.submit(search, query) for query in queries]
+
+        for i, (query, future) in enumerate(zip(queries, futures), 1):
+            try:
+                result = future.result()
+
+                # Check if we got results
+                if result.get("data") and len(result["data"]) > 0:
+                    if verbose:
+                        print(f"✓ Query {i}/{len(queries)} '{query}' succeeded with {len(result['data'])} results", file=sys.stderr)
+                    result["query_used"] = query
+                    result["query_attempt"] = i
+                    return result
+                else:
+                    if verbose:
+                        print(f"✗ Query {i}/{len(queries)} '{query}' returned no results", file=sys.stderr)
+
+            except Exception as e:
                 if verbose:
-                    print(f"✓ Query succeeded with {len(result['data'])} results", file=sys.stderr)
-                result["query_used"] = query
-                result["query_attempt"] = i
-                return result
-            else:
-                if verbose:
-                    print(f"✗ Query returned no results", file=sys.stderr)
-
-        except Exception as e:
-            if verbose:
-                print(f"✗ Query failed: {str(e)}", file=sys.stderr)
-
-        # Rate limiting - wait between attempts
-        if i < len(queries):
-            time.sleep(1)
+                    print(f"✗ Query {i}/{len(queries)} '{query}' failed: {str(e)}", file=sys.stderr)
+    finally:
+        # Don't wait for slower formulations once we have an answer
+        cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return None
 
 
 def format_paper(paper: Dict[str, Any], index: int) -> str:
     """Format a single paper for display"""
-    title = paper.get("title", "Unknown Title")
-    authors = paper.get("authors", [])
-    author_str = ", ".join([a.get("name", "Unknown") for a in authors[:3]])
-    if len(authors) > 3:
-        author_str += " et al."
-
-    year = paper.get("year", "N/A")
-    citations = paper.get("citationCount", 0)
-    url = paper.get("url", "N/A")
-    venue = paper.get("venue", "N/A")
-
-    output = f"\n{index}. {title}\n"
-    output += f"   Authors: {author_str}\n"
-    output += f"   Year: {year} | Citations: {citations} | Venue: {venue}\n"
-    output += f"   URL: {url}\n"
-
-    abstract = paper.get("abstract")
-    if abstract:
-        # Truncate long abstracts
-        abstract_preview = abstract
-        output += f"   Abstract: {abstract_preview}\n"
-
-    return output
+    get = paper.get
+    title = get("title", "Unknown Title")
+    authors = get("authors", [])
+    author_str = ", ".join(a.get("name", "Unknown") for a in islice(authors, 3))
+    et_al = " et al." if len(authors) > 3 else ""
+
+    year = get("year", "N/A")
+    citations = get("citationCount", 0)
+    url = get("url", "N/A")
+    venue = get("venue", "N/A")
+    abstract = get("abstract")
+
+    return (
+        f"\n{index}. {title}\n"
+        f"   Authors: {author_str}{et_al}\n"
+        f"   Year: {year} | Citations: {citations} | Venue: {venue}\n"
+        f"   URL: {url}\n"
+        + (f"   Abstract: {abstract}\n" if abstract else "")
+    )
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Query Semantic Scholar API for longevity research papers with retry logic",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -215,6 +671,9 @@ Examples:
   # Get recent papers with JSON output
   %(prog)s --queries "NAD+ longevity" "nicotinamide aging" \\
            --sort recent --json
+
+  # Stream one paper per line (NDJSON), e.g. for piping into jq
+  %(prog)s --queries "senolytics aging" --ndjson | jq -r .title
         """
     )
 
@@ -222,7 +681,7 @@ Examples:
         "--queries",
         nargs="+",
         required=True,
-        help="List of query strings to try in sequence"
+        help="List of query strings to try (run concurrently, first success in order wins)"
     )
 
     parser.add_argument(
@@ -255,37 +714,86 @@ Examples:
         "--sort",
         choices=["recent", "citations"],
         default="recent",
-        help="Sort order: recent (by date) or citations (by count)"
+        help="Sort order: recent (relevance-ranked page, default) or citations "
+             "(most cited across all matches; downloads up to 1000 papers per request). "
+             "Citation sorting uses bulk search, which requires every query term to match "
+             "and treats + | - \" * ( ) ~ as boolean operators; if it finds nothing, the "
+             "relevance page is sorted by citations instead"
     )
 
-    parser.add_argument(
+    output_format = parser.add_mutually_exclusive_group()
+
+    output_format.add_argument(
         "--json",
         action="store_true",
         help="Output raw JSON instead of formatted text"
     )
 
+    output_format.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Output one paper per line as compact JSON"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache"
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=86400,
+        help="Seconds a cached response stays valid (default: 86400)"
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Print status messages to stderr"
     )
 
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
     args = parser.parse_args()
 
+    # Reject bad input before loading .env or opening connections
+    queries = normalize_queries(args.queries)
+    if not queries:
+        parser.error("--queries must include at least one non-blank query")
+    if not 1 <= args.limit <= 100:
+        parser.error("--limit must be between 1 and 100")
+    if args.offset < 0:
+        parser.error("--offset must not be negative")
+    if args.cache_ttl < 0:
+        parser.error("--cache-ttl must not be negative")
+
+    load_env()
+
     # Initialize API client
-    api = SemanticScholarAPI()
+    cache = None if args.no_cache else DiskCache(ttl=args.cache_ttl)
+    api = SemanticScholarAPI(cache=cache)
 
     # Execute query with retry
-    result = query_with_retry(
-        api=api,
-        queries=args.queries,
-        limit=args.limit,
-        offset=args.offset,
-        year_filter=args.year_filter,
-        date_filter=args.date_filter,
-        sort=args.sort,
-        verbose=args.verbose
-    )
+    try:
+        result = query_with_retry(
+            api=api,
+            queries=queries,
+            limit=args.limit,
+            offset=args.offset,
+            year_filter=args.year_filter,
+            date_filter=args.date_filter,
+            sort=args.sort,
+            verbose=args.verbose
+        )
+    finally:
+        api.close()
+        if cache is not None:
+            cache.close()
 
     if result is None:
         print("ERROR: All query attempts failed or returned no results", file=sys.stderr)
@@ -293,19 +801,24 @@ Examples:
 
     # Output results
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(dump_json(result))
+    elif args.ndjson:
+        sys.stdout.buffer.write(b"".join(dump_json_line(paper) + b"\n" for paper in result.get("data", [])))
     else:
-        print(f"\n{'='*80}")
-        print(f"Query: '{result.get('query_used')}'")
-        print(f"Attempt: {result.get('query_attempt')}/{len(args.queries)}")
-        print(f"Total papers found: {result.get('total', 0)}")
-        print(f"Showing: {len(result.get('data', []))} papers")
-        print(f"{'='*80}")
-
-        for i, paper in enumerate(result.get("data", []), 1):
-            print(format_paper(paper, i))
-
-        print(f"\n{'='*80}\n")
+        # Build the whole report first and emit it with a single write
+        papers = result.get("data", [])
+        rule = "=" * 80
+        out = [
+            f"\n{rule}\n"
+            f"Query: '{result.get('query_used')}'\n"
+            f"Attempt: {result.get('query_attempt')}/{len(queries)}\n"
+            f"Total papers found: {result.get('total', 0)}\n"
+            f"Showing: {len(papers)} papers\n"
+            f"{rule}\n"
+        ]
+        out.extend(f"{format_paper(paper, i)}\n" for i, paper in enumerate(papers, 1))
+        out.append(f"\n{rule}\n\n")
+        sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Offline checks for query_longevity_papers.py
+Run with: python3 -m unittest test_query_longevity_papers
+"""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import query_longevity_papers as qlp
+
+
+RELEVANCE_PAGE = {
+    "total": 3,
+    "offset": 0,
+    "data": [
+        {"paperId": "a", "title": "A", "citationCount": 5},
+        {"paperId": "b", "title": "B", "citationCount": None},
+        {"paperId": "c", "title": "C", "citationCount": 50},
+    ]
+}
+
+
+def fake_fetch(bulk_response):
+    """Build a _fetch replacement answering bulk and relevance search paths"""
+    requested = []
+
+    def fetch(path, cancelled=None):
+        url = urlsplit(path)
+        requested.append((url.path, parse_qs(url.query)))
+        if url.path.endswith("/paper/search/bulk"):
+            if isinstance(bulk_response, Exception):
+                raise bulk_response
+            return json.dumps(bulk_response).encode()
+        return json.dumps(RELEVANCE_PAGE).encode()
+
+    return fetch, requested
+
+
+class CitationSortFallbackTest(unittest.TestCase):
+    def search(self, bulk_response):
+        api = qlp.SemanticScholarAPI(api_key="test")
+        fetch, requested = fake_fetch(bulk_response)
+        with mock.patch.object(api, "_fetch", side_effect=fetch):
+            result = api.search_papers("rapamycin anti-aging effects", sort="citations")
+        return result, [path for path, _ in requested]
+
+    def test_bulk_results_are_returned_as_is(self):
+        bulk = {"total": 1, "token": None, "data": [{"paperId": "z", "citationCount": 900}]}
+        result, paths = self.search(bulk)
+        self.assertEqual([p["paperId"] for p in result["data"]], ["z"])
+        self.assertEqual(paths, ["/graph/v1/paper/search/bulk"])
+
+    def test_empty_bulk_falls_back_to_sorted_relevance_page(self):
+        result, paths = self.search({"total": 0, "token": None, "data": []})
+        self.assertEqual([p["paperId"] for p in result["data"]], ["c", "a", "b"])
+        self.assertEqual(paths, ["/graph/v1/paper/search/bulk", "/graph/v1/paper/search"])
+
+    def test_rejected_bulk_falls_back_to_sorted_relevance_page(self):
+        result, paths = self.search(qlp.HTTPStatusError(400, "bad query"))
+        self.assertEqual([p["paperId"] for p in result["data"]], ["c", "a", "b"])
+        self.assertEqual(paths[-1], "/graph/v1/paper/search")
+
+    def test_empty_bulk_does_not_fail_query_with_retry(self):
+        api = qlp.SemanticScholarAPI(api_key="test")
+        fetch, _ = fake_fetch({"total": 0, "token": None, "data": []})
+        with mock.patch.object(api, "_fetch", side_effect=fetch):
+            result = qlp.query_with_retry(api, ["rapamycin anti-aging effects"], sort="citations")
+        self.assertIsNotNone(result)
+        self.assertEqual(result["query_used"], "rapamycin anti-aging effects")
+
+
+class RateLimiterDefaultsTest(unittest.TestCase):
+    def test_api_key_caps_rate_at_one_request_per_second(self):
+        bucket = qlp.SemanticScholarAPI(api_key="test").rate_limiter
+        self.assertEqual(bucket.capacity, 1.0)
+        for _ in range(50):
+            bucket.increase_rate()
+        self.assertEqual(bucket.rate, 1.0)
+
+    def test_second_request_waits_for_a_refill(self):
+        bucket = qlp.SemanticScholarAPI(api_key="test").rate_limiter
+        start = time.monotonic()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+
+
+class DiskCachePurgeTest(unittest.TestCase):
+    def setUp(self):
+        self.path = Path(tempfile.mkdtemp()) / "papers.sqlite"
+
+    def test_short_ttl_write_keeps_entries_other_callers_still_accept(self):
+        shared = qlp.DiskCache(self.path)
+        shared.put("kept", b"payload")
+        shared.close()
+
+        impatient = qlp.DiskCache(self.path, ttl=0)
+        impatient.put("other", b"payload")
+        impatient.close()
+
+        shared = qlp.DiskCache(self.path)
+        self.assertEqual(shared.get("kept"), b"payload")
+        shared.close()
+
+    def test_entries_past_max_age_are_purged(self):
+        cache = qlp.DiskCache(self.path)
+        cache.put("old", b"payload")
+        cache._connect().execute(
+            "UPDATE responses SET ts = ? WHERE key = 'old'", (time.time() - cache.MAX_AGE - 1,)
+        )
+        cache.put("new", b"payload")
+        keys = [row[0] for row in cache._connect().execute("SELECT key FROM responses")]
+        self.assertEqual(keys, ["new"])
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()